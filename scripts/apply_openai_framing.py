@@ -128,11 +128,14 @@ def apply_framing_to_file(
 
     # Apply framing classification
     print(f"\n  Classifying {len(df_filtered):,} items...")
+    stream_path = output_path.with_suffix('.partial.jsonl')
     df_framed = analyzer.analyze_dataframe(
         df=df_filtered,
         title_col=title_col,
         body_col=body_col,
-        delay=0.1  # 0.1 second delay to avoid rate limits
+        concurrency=10,  # Concurrent requests in flight
+        # Results stream here as they arrive, so an interrupted run resumes
+        stream_path=str(stream_path)
     )
 
     # Show results
@@ -153,6 +156,9 @@ def apply_framing_to_file(
     df_framed.to_csv(output_path, index=False)
     print(f"\n  ✓ Saved: {output_path}")
 
+    # The final CSV now holds every result; a stale stream must not seed the next run
+    stream_path.unlink(missing_ok=True)
+
     return df_framed
 
 
@@ -177,7 +183,9 @@ def main():
 
     # Initialize analyzer
     print("\nInitializing OpenAI analyzer...")
-    analyzer = OpenAIFramingAnalyzer(api_key=api_key, model="gpt-4o-mini")
+    # --no-cache re-queries every item and refreshes the stored responses
+    analyzer = OpenAIFramingAnalyzer(api_key=api_key, model="gpt-4o-mini",
+                                     use_cache='--no-cache' not in sys.argv)
     print("✓ Analyzer initialized")
 
     # Define datasets
@@ -83,7 +83,7 @@ def test_framing_classification():
         df=df_sample,
         title_col='title',
         body_col='selftext',
-        delay=0.1  # 0.1 second delay between API calls
+        concurrency=10  # Concurrent requests in flight
     )
 
     # Show results
@@ -2,12 +2,20 @@
 import pandas as pd
 import os
 import json
+import hashlib
+import sqlite3
 from openai import OpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+# Persistent response cache so repeated smoke-test runs don't re-pay for identical prompts
+CACHE_PATH = ".cache/frame_llm.sqlite"
+os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+cache = sqlite3.connect(CACHE_PATH)
+cache.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, result TEXT)")
+
 # Configuration
 COUNTRIES = {
     "North Korea": ["data/nk/nk_posts_merged.csv", "data/nk/nk_posts_hanoi_extended.csv"],
@@ -128,6 +136,11 @@ Include:
 ## Response Format (JSON only)
 {{"frame": "THREAT|DIPLOMACY|ECONOMIC|HUMANITARIAN|NEUTRAL", "confidence": 0.0-1.0, "reason": "One sentence explaining classification rationale"}}"""
 
+    key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+    row = cache.execute("SELECT result FROM responses WHERE key = ?", (key,)).fetchone()
+    if row is not None:
+        return json.loads(row[0])
+
     try:
         response = client.chat.completions.create(
             model="gpt-4o-mini",
@@ -139,7 +152,10 @@ Include:
             max_tokens=200,
             response_format={"type": "json_object"}
         )
-        return json.loads(response.choices[0].message.content)
+        result = json.loads(response.choices[0].message.content)
+        cache.execute("INSERT OR REPLACE INTO responses VALUES (?, ?)", (key, json.dumps(result)))
+        cache.commit()
+        return result
     except Exception as e:
         return {"frame": "ERROR", "reason": str(e)}
 
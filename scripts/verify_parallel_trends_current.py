@@ -36,6 +36,14 @@ def assign_period(month):
         return 'P3'
     return None
 
+# Every month from Reddit's launch on, resolved once: earlier months cannot occur,
+# and anything after 2019-12 has no period, same as assign_period
+PERIOD_TABLE = {str(m): assign_period(str(m)) for m in pd.period_range('2005-06', '2019-12', freq='M')}
+
+def map_periods(months):
+    """Label a Series of 'YYYY-MM' months with their period via PERIOD_TABLE."""
+    return months.map(PERIOD_TABLE)
+
 def test_parallel_trends(nk_df, ctrl_df, ctrl_name, period, outcome_col):
     """Test parallel trends in specified pre-treatment period."""
     nk_sub = nk_df[nk_df['period'] == period].copy()
@@ -71,7 +79,7 @@ def test_parallel_trends(nk_df, ctrl_df, ctrl_name, period, outcome_col):
 
 # Add period to sentiment data
 for df in [nk_sent, china_sent, iran_sent, russia_sent]:
-    df['period'] = df['month'].apply(assign_period)
+    df['period'] = map_periods(df['month'])
 
 results = []
 
@@ -107,7 +115,7 @@ print(f"Loaded: NK={len(nk_frame)}, China={len(china_frame)}, Iran={len(iran_fra
 
 # Add period to framing data
 for df in [nk_frame, china_frame, iran_frame, russia_frame]:
-    df['period'] = df['month'].apply(assign_period)
+    df['period'] = map_periods(df['month'])
 
 # Test Framing P1 (Pre-Singapore)
 print("\n[Framing] Pre-Singapore (P1):")
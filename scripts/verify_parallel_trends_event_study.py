@@ -2,8 +2,10 @@
 import pandas as pd
 import numpy as np
 import statsmodels.formula.api as smf
+import matplotlib
 import matplotlib.pyplot as plt
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Configuration
 DATA_DIR = 'data/processed'
@@ -19,6 +21,9 @@ FILES = {
 # Treatment Start: Singapore Summit June 2018
 TREATMENT_MONTH = '2018-06'
 
+# Columns run_event_study reads
+REGRESSION_COLUMNS = ['roberta_compound', 'month', 'topic', 'is_treated']
+
 def load_data():
     dfs = []
     for country, filename in FILES.items():
@@ -28,16 +33,22 @@ def load_data():
             try:
                 # Load with robust parsing
                 # NEW: Load 'body' to filter removed/deleted
-                df = pd.read_csv(path, usecols=['roberta_compound', 'created_utc', 'body'], on_bad_lines='skip', low_memory=False)
+                df = pd.read_csv(path, usecols=['roberta_compound', 'created_utc', 'body'],
+                                 on_bad_lines='skip', low_memory=False)
                 
                 # Filter removed/deleted
                 initial_len = len(df)
                 df = df[~df['body'].isin(['[removed]', '[deleted]'])]
                 df = df.dropna(subset=['body'])
                 print(f"  - Filtered {initial_len - len(df)} removed/deleted comments (Remaining: {len(df)})")
+                # Comment text is only needed for the filter above
+                df = df.drop(columns='body')
                 
+                df['roberta_compound'] = pd.to_numeric(df['roberta_compound'], errors='coerce').astype('float32')
                 df['created_utc'] = pd.to_numeric(df['created_utc'], errors='coerce')
                 df = df.dropna(subset=['created_utc'])
+                # Epoch seconds fit in int32 until 2038
+                df['created_utc'] = df['created_utc'].astype('int32')
                 
                 df['date'] = pd.to_datetime(df['created_utc'], unit='s')
                 df['month'] = df['date'].dt.to_period('M')
@@ -110,10 +121,14 @@ def run_event_study(df, control_name):
         except KeyError:
             # Maybe dropped or ref?
             pass
-            
+
+    return months, coefs, cis, control_name
+
+def plot_event_study(months, coefs, cis, control_name):
+    # Runs in the main process: matplotlib state does not cross process boundaries
     # Visualize
     plt.figure(figsize=(12, 6))
-    plt.errorbar(months, coefs, yerr=cis, fmt='-o', color='b', ecolor='gray', capsize=5)
+    plt.errorbar(months, coefs, yerr=cis, fmt='-o', color='b', ecolor='gray', capsize=5, rasterized=True)
     plt.axvline(x=-0.5, color='r', linestyle='--', label='Singapore Summit')
     plt.axhline(y=0, color='k', linestyle='-', linewidth=0.8)
     
@@ -143,7 +158,8 @@ def run_event_study(df, control_name):
     plt.legend()
     
     out_path = os.path.join(FIGURES_DIR, f'event_study_{control_name.lower()}.pdf')
-    plt.savefig(out_path)
+    plt.savefig(out_path, dpi=150)
+    plt.close('all')
     print(f"Saved plot to {out_path}")
 
 def main():
@@ -151,14 +167,18 @@ def main():
     df = load_data()
     
     print("\nRunning Event Studies...")
-    # Run for China (Best Control)
-    run_event_study(df, 'China')
-    
-    # Run for Iran (Secondary)
-    run_event_study(df, 'Iran')
-    
-    # Run for Russia
-    run_event_study(df, 'Russia')
+    # China (Best Control), Iran (Secondary), Russia
+    # Each regression is independent, so fit them in parallel
+    controls = ['China', 'Iran', 'Russia']
+    with ProcessPoolExecutor(max_workers=len(controls)) as executor:
+        # Ship each worker only its NK + control rows and the regression columns
+        futures = [executor.submit(run_event_study, df.loc[df['topic'].isin(['NK', c]), REGRESSION_COLUMNS], c)
+                   for c in controls]
+        results = [f.result() for f in futures]
+    
+    for months, coefs, cis, control_name in results:
+        plot_event_study(months, coefs, cis, control_name)
 
 if __name__ == "__main__":
+    matplotlib.use('Agg')  # Headless: figures are only written to disk
     main()
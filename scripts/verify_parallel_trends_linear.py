@@ -24,8 +24,11 @@ def load_data():
             print(f"Loading {country} from {path}...")
             try:
                 df = pd.read_csv(path, usecols=['roberta_compound', 'created_utc'], low_memory=False)
+                df['roberta_compound'] = pd.to_numeric(df['roberta_compound'], errors='coerce').astype('float32')
                 df['created_utc'] = pd.to_numeric(df['created_utc'], errors='coerce')
                 df = df.dropna(subset=['created_utc'])
+                # Epoch seconds fit in int32 until 2038
+                df['created_utc'] = df['created_utc'].astype('int32')
                 df['date'] = pd.to_datetime(df['created_utc'], unit='s')
                 df['month'] = df['date'].dt.to_period('M')
                 
@@ -46,18 +49,15 @@ def load_data():
 def run_linear_test(nk_df, control_df, control_name):
     print(f"\n--- Linear Trend Test (Monthly Aggregated): NK vs {control_name} ---")
     
-    # Prepare Data
-    t = nk_df.copy()
-    t['is_treat'] = 1
-    
-    c = control_df.copy()
-    c['is_treat'] = 0
-    
-    combined = pd.concat([t, c], ignore_index=True)
-    
     # AGGREGATE TO MONTHLY MEANS
-    # Group by is_treat and month
-    combined_agg = combined.groupby(['is_treat', 'month'])['roberta_compound'].mean().reset_index()
+    # Collapse each group before stacking so the per-comment frames are never concatenated
+    tm = nk_df.groupby('month', observed=True)['roberta_compound'].mean().reset_index()
+    tm['is_treat'] = 1
+
+    cm = control_df.groupby('month', observed=True)['roberta_compound'].mean().reset_index()
+    cm['is_treat'] = 0
+
+    combined_agg = pd.concat([tm, cm], ignore_index=True)
     
     # Create Linear Time Trend (0, 1, 2, ...)
     months = sorted(combined_agg['month'].unique())
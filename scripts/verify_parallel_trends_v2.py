@@ -42,6 +42,13 @@ def assign_period(month_str):
     elif '2019-03' <= month_str <= '2019-12': return 'P3'
     return None
 
+# assign_period for Reddit's launch (2005-06) through the last labelled month (2019-12)
+PERIOD_TABLE = {str(m): assign_period(str(m)) for m in pd.period_range('2005-06', '2019-12', freq='M')}
+
+def map_periods(months):
+    """Label a Series of 'YYYY-MM' months with their period via PERIOD_TABLE."""
+    return months.map(PERIOD_TABLE)
+
 def test_parallel_trends(df_treat, df_control, treat_name, control_name, period_code, label):
     t = df_treat[df_treat['period'] == period_code].copy()
     c = df_control[df_control['period'] == period_code].copy()
@@ -80,7 +87,7 @@ def main():
         if df is not None:
             df['month'] = df['date'].dt.to_period('M').astype(str)
             df['framing_score'] = df['frame'].map(SCALE).fillna(0)
-            df['period'] = df['month'].apply(assign_period)
+            df['period'] = map_periods(df['month'])
             datasets[country] = df.dropna(subset=['period'])
             
     nk = datasets['nk']
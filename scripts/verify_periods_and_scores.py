@@ -15,8 +15,11 @@ def check_periods_and_quality():
     df = pd.read_csv('data/processed/nk_comments_recursive_roberta.csv', low_memory=False)
     
     # Coerce numeric
+    df['roberta_compound'] = pd.to_numeric(df['roberta_compound'], errors='coerce').astype('float32')
     df['created_utc'] = pd.to_numeric(df['created_utc'], errors='coerce')
     df = df.dropna(subset=['created_utc'])
+    # Epoch seconds fit in int32 until 2038
+    df['created_utc'] = df['created_utc'].astype('int32')
     df['date'] = pd.to_datetime(df['created_utc'], unit='s')
     
     print("\n=== 1. PERIOD ASSIGNMENT VERIFICATION ===")
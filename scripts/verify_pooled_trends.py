@@ -2,6 +2,7 @@
 import pandas as pd
 import numpy as np
 import statsmodels.formula.api as smf
+from scipy import stats
 import matplotlib.pyplot as plt
 import os
 
@@ -16,7 +17,8 @@ FILES = {
     'Russia': 'russia_comments_recursive_roberta_final.csv'
 }
 
-TREATMENT_MONTH = '2018-06'
+# Treatment Start: Singapore Summit June 2018, as a year*12 + month key
+TREATMENT_MONTH = 2018 * 12 + 6
 
 def load_data():
     dfs = []
@@ -24,16 +26,38 @@ def load_data():
         path = os.path.join(DATA_DIR, filename)
         if os.path.exists(path):
             try:
-                df = pd.read_csv(path, usecols=['roberta_compound', 'created_utc'], low_memory=False)
-                df['created_utc'] = pd.to_numeric(df['created_utc'], errors='coerce')
-                df = df.dropna(subset=['created_utc'])
-                df['date'] = pd.to_datetime(df['created_utc'], unit='s')
-                df['month'] = df['date'].dt.to_period('M')
-                df['topic'] = country
-                dfs.append(df)
+                # Typed Parquet copy next to the CSV; parsed once, reused on later runs
+                cache = path.replace('.csv', '.cached.parquet')
+                if os.path.exists(cache):
+                    df = pd.read_parquet(cache, columns=['roberta_compound', 'created_utc'])
+                else:
+                    # Read as text and coerce, so malformed rows become NaN instead of failing the file
+                    df = pd.read_csv(path, usecols=['roberta_compound', 'created_utc'], engine='pyarrow',
+                                     dtype={'roberta_compound': 'string', 'created_utc': 'string'})
+                    df = pd.DataFrame({
+                        'roberta_compound': pd.to_numeric(df['roberta_compound'], errors='coerce').astype('float32'),
+                        'created_utc': pd.to_numeric(df['created_utc'], errors='coerce')
+                    })
+                    df = df.dropna(subset=['created_utc'])
+                    df['created_utc'] = df['created_utc'].astype('int64')
+                    df.to_parquet(cache, compression='zstd', index=False)
+                # Integer month key (year*12 + month) straight from the epoch, no Period objects
+                months_since_epoch = (df['created_utc'].to_numpy(dtype='int64')
+                                      .astype('datetime64[s]').astype('datetime64[M]').astype(np.int32))
+                month = months_since_epoch + np.int32(1970 * 12 + 1)
+                # Reduce each file to three narrow columns before it is kept around for the concat
+                dfs.append(pd.DataFrame({
+                    'roberta_compound': df['roberta_compound'].to_numpy(dtype=np.float32),
+                    'rel_month': (month - TREATMENT_MONTH).astype(np.int16),
+                    'topic': pd.Categorical.from_codes(np.full(len(df), list(FILES).index(country), dtype=np.int8),
+                                                       categories=list(FILES))
+                }))
+                del df
             except Exception as e:
                 print(f"Error loading {country}: {e}")
-    return pd.concat(dfs)
+    combined = pd.concat(dfs, copy=False, ignore_index=True)
+    del dfs
+    return combined
 
 def verify_pooled_trends(df):
     print("\n--- Event Study: NK vs POOLED CONTROL (China+Iran+Russia) ---")
@@ -41,48 +65,57 @@ def verify_pooled_trends(df):
     # Define Treated and Control
     df['is_treated'] = (df['topic'] == 'NK').astype(int)
     
-    # Create relative time
-    df['month_dt'] = df['month'].dt.to_timestamp()
-    treatment_start_dt = pd.Timestamp(TREATMENT_MONTH + '-01')
-    
-    df['rel_month'] = ((df['month_dt'].dt.year - treatment_start_dt.year) * 12 + 
-                      (df['month_dt'].dt.month - treatment_start_dt.month))
-    
     # Filter Window: P1 (-17) to P2 start
     subset = df[(df['rel_month'] >= -17) & (df['rel_month'] <= 0)].copy()
     
-    # Set Reference = -1
-    subset['rel_month_cat'] = subset['rel_month'].astype('category')
-    categories = sorted(subset['rel_month_cat'].unique())
-    if -1 in categories:
-        categories.remove(-1)
-        categories = [-1] + categories
-        subset['rel_month_cat'] = subset['rel_month_cat'].cat.reorder_categories(categories, ordered=True)
+    # Collapse to (treated x rel_month) cell means. The model is saturated in these cells,
+    # so count-weighted WLS on the means gives exactly the comment-level OLS coefficients
+    cell = (subset.groupby(['is_treated', 'rel_month'], observed=True)['roberta_compound']
+            .agg(roberta_compound='mean', n='count', var='var')
+            .reset_index())
+    
+    # Set Reference = -1 (first category, so it is the omitted level)
+    categories = [-1] + [i for i in range(-17, 1) if i != -1]
+    cell['rel_month_cat'] = pd.Categorical(cell['rel_month'], categories=categories, ordered=True)
     
     # Run Regression
     formula = "roberta_compound ~ is_treated * C(rel_month_cat)"
-    mod = smf.ols(formula, data=subset)
-    res = mod.fit(cov_type='HC1')
+    mod = smf.wls(formula, data=cell, weights=cell['n'])
+    res = mod.fit()
+    params = res.params
+    
+    # HC1 robust SEs of the comment-level model. A comment's residual is its deviation from
+    # the cell mean plus the cell-mean residual, so a cell's summed squared residuals are
+    # (n - 1) * var + n * resid^2 (the second term is zero when every cell is present)
+    X = mod.exog
+    n_cell = cell['n'].to_numpy(dtype=np.float64)
+    ssr_cell = ((n_cell - 1) * cell['var'].fillna(0).to_numpy(dtype=np.float64)
+                + n_cell * np.asarray(res.resid) ** 2)
+    bread = np.linalg.pinv(X.T @ (X * n_cell[:, None]))
+    meat = X.T @ (X * ssr_cell[:, None])
+    n_obs, k = n_cell.sum(), X.shape[1]
+    cov = bread @ meat @ bread * n_obs / (n_obs - k)
+    bse = pd.Series(np.sqrt(np.diag(cov)), index=params.index)
+    pvalues = pd.Series(2 * stats.norm.sf(np.abs(params / bse)), index=params.index)
     
     # Check Pre-trend coefficients (excluding reference -1)
-    failures = 0
-    total_checks = 0
+    terms = [f"is_treated:C(rel_month_cat)[T.{i}]" for i in range(-17, 0) if i != -1] # Pre-period only
+    mask = params.index.isin(terms)
+    coefs = params[mask]
+    pvals = pvalues[mask]
+    sig_mask = pvals < 0.05
+    failures = int(sig_mask.sum())
+    total_checks = len(pvals)
     
-    print("\nPre-trend Coefficients (should be close to 0):")
-    for i in range(-17, 0): # Pre-period only
-        if i == -1: continue
-        term = f"is_treated:C(rel_month_cat)[T.{i}]"
-        try:
-            coef = res.params[term]
-            p_val = res.pvalues[term]
-            sig = "***" if p_val < 0.01 else ("**" if p_val < 0.05 else ("*" if p_val < 0.1 else ""))
-            print(f"  Month {i}: {coef:.4f} {sig} (p={p_val:.4f})")
-            
-            if p_val < 0.05:
-                failures += 1
-            total_checks += 1
-        except KeyError:
-            pass
+    # One table, one print
+    table = pd.DataFrame({
+        'month': [name.split('[T.')[1].rstrip(']') for name in coefs.index],
+        'coef': coefs.values,
+        'p': pvals.values,
+        'sig': np.select([pvals.values < 0.01, sig_mask.values, pvals.values < 0.1], ['***', '**', '*'], default='')
+    })
+    print("\nPre-trend Coefficients (should be close to 0):\n"
+          + table.to_string(index=False, float_format='{:.4f}'.format))
             
     print(f"\nResult: {failures} significant deviations out of {total_checks} months.")
     if failures <= 2: # Allow small tolerance
@@ -1,13 +1,26 @@
 
 import pandas as pd
 import sys
+import os
 
 INPUT_FILE = 'data/processed/nk_comments_recursive.csv'
+CACHE_FILE = INPUT_FILE.replace('.csv', '.cached.parquet')
+
+# Only the thread-structure columns are needed, so the Parquet cache stays narrow
+CACHE_COLUMNS = ['id', 'parent_id', 'parent_post_id', 'is_top_root', 'root_id', 'score']
 
 def verify_structure():
-    print(f"Reading {INPUT_FILE}...")
     try:
-        df = pd.read_csv(INPUT_FILE, low_memory=False)
+        if os.path.exists(CACHE_FILE):
+            print(f"Reading {CACHE_FILE}...")
+            df = pd.read_parquet(CACHE_FILE)
+        else:
+            print(f"Reading {INPUT_FILE}...")
+            df = pd.read_csv(INPUT_FILE, usecols=lambda c: c in CACHE_COLUMNS, low_memory=False)
+            # is_top_root can mix bools and 'True'/'False' strings; store one type
+            if 'is_top_root' in df.columns:
+                df['is_top_root'] = df['is_top_root'].astype(str)
+            df.to_parquet(CACHE_FILE, compression='zstd', index=False)
     except Exception as e:
         print(f"Error reading CSV: {e}")
         return
@@ -21,6 +34,15 @@ def verify_structure():
             print(f"MISSING COLUMN: {col}")
             return
 
+    # is_top_root may come through as bool or 'True'/'False' strings; normalise once
+    df['is_top_root'] = (df['is_top_root']
+                         .map({'True': True, 'False': False, True: True, False: False})
+                         .fillna(False).astype('bool'))
+
+    # Thread ids repeat heavily; categorical codes make counting, grouping and isin int-based
+    for col in ['parent_post_id', 'root_id', 'id']:
+        df[col] = df[col].astype('category')
+
     # Check Post Groups
     post_counts = df['parent_post_id'].value_counts()
     print(f"\nUnique Posts Collected: {len(post_counts)}")
@@ -28,20 +50,19 @@ def verify_structure():
     # Analyze a few random posts
     sample_posts = post_counts.head(5).index.tolist()
     
+    # Group once instead of scanning the whole frame for every sampled post
+    grouped = df.groupby('parent_post_id', sort=False, observed=True)
+    
     for pid in sample_posts:
         print(f"\n--- Post {pid} ---")
-        subset = df[df['parent_post_id'] == pid]
+        subset = grouped.get_group(pid)
         print(f"  Total Comments: {len(subset)}")
         
         # 1. Check Top 5 Roots
         # Roots are where is_top_root == True
-        roots = subset[subset['is_top_root'] == True]
-        # In my script, is_top_root is string 'True'/'False' or boolean? pandas might infer.
-        # Let's check unique values
-        # print(f"  is_top_root values: {subset['is_top_root'].unique()}")
-        
-        # Adjust for possible string/bool type
-        roots = subset[subset['is_top_root'].astype(str) == 'True']
+        is_root = subset['is_top_root']
+        roots = subset[is_root]
+        roots_ids = frozenset(roots['id'].to_numpy().tolist())
         
         print(f"  Top Roots Found: {len(roots)}")
         for _, r in roots.iterrows():
@@ -49,17 +70,13 @@ def verify_structure():
             
         # 2. Check Descendants
         # Any comment that is NOT a top root but has root_id set
-        descendants = subset[subset['is_top_root'].astype(str) == 'False']
+        descendants = subset[~is_root]
         print(f"  Descendants Found: {len(descendants)}")
         
         # Verify linkage
-        orphan_count = 0
-        for _, d in descendants.iterrows():
-            if d['root_id'] not in roots['id'].values:
-                # This might happen if adjacency list logic wasn't perfect or root_id matching type mismatch
-                # But logic says root_id corresponds to id_clean.
-                # Let's strict check
-                orphan_count += 1
+        # Orphans can happen if adjacency list logic wasn't perfect or root_id matching type mismatch
+        orphan_mask = ~descendants['root_id'].isin(roots_ids)
+        orphan_count = int(orphan_mask.sum())
                 
         # print(f"  Orphans (root_id not in roots): {orphan_count}")
         
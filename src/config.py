@@ -3,6 +3,13 @@ Configuration settings for the analysis
 """
 from pathlib import Path
 
+__all__ = [
+    'PROJECT_ROOT', 'DATA_DIR', 'SAMPLE_DIR', 'RESULTS_DIR', 'FIGURES_DIR', 'GRAPHRAG_DIR', 'CACHE_DIR',
+    'PERIODS', 'INTERVENTION_DATE', 'CONTROL_GROUPS', 'DID_CONFIG',
+    'FRAME_CATEGORIES', 'SENTIMENT_MODEL', 'OPENAI_MODEL',
+    'DISTILLED_BASE_MODEL', 'DISTILLED_FRAMING_DIR'
+]
+
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
@@ -17,6 +24,9 @@ FIGURES_DIR = PROJECT_ROOT / "figures"
 # GraphRAG directories
 GRAPHRAG_DIR = PROJECT_ROOT / "graphrag"
 
+# Local cache for API responses (git-ignored)
+CACHE_DIR = PROJECT_ROOT / ".cache"
+
 # Analysis periods
 PERIODS = {
     "tension": {
@@ -130,3 +140,7 @@ SENTIMENT_MODEL = "nlptown/bert-base-multilingual-uncased-sentiment"
 
 # OpenAI settings (for framing classification)
 OPENAI_MODEL = "gpt-4o-mini"
+
+# Local framing classifier distilled from OpenAI labels (weights are git-ignored)
+DISTILLED_BASE_MODEL = "distilbert-base-uncased"
+DISTILLED_FRAMING_DIR = PROJECT_ROOT / "models" / "framing_distilbert"
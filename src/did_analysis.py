@@ -9,13 +9,34 @@ import pandas as pd
 import numpy as np
 import statsmodels.formula.api as smf
 import statsmodels.api as sm
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 import os
-import json
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from patsy import dmatrices
 
 from src.config import DID_CONFIG, INTERVENTION_DATE
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the bootstrap then runs on plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# ITS-style DID specification shared by the OLS fit and the bootstrap
+DID_FORMULA = 'sentiment_mean ~ treat + time + post + treat:time + treat:post + treat:time:post'
+
+
+@njit(cache=True)
+def _did_fit(X, y):
+    """Solve the OLS normal equations for one (re)sample and return all coefficients."""
+    XtX = X.T @ X
+    return np.linalg.solve(XtX, X.T @ y)
+
 
 class DIDAnalyzer:
     """Difference-in-Differences estimator for causal inference."""
@@ -29,30 +50,52 @@ class DIDAnalyzer:
             control_data: Control group monthly sentiment data
             control_name: Name of control group
         """
-        self.treatment_data = treatment_data.copy()
-        self.control_data = control_data.copy()
+        # Inputs are not modified, so keep references instead of copies
+        self.treatment_data = treatment_data
+        self.control_data = control_data
         self.control_name = control_name
 
-        # Prepare combined dataset
-        self.treatment_data['treat'] = 1
-        self.treatment_data['group'] = 'North Korea'
-        self.control_data['treat'] = 0
-        self.control_data['group'] = control_name
+        # Prepare combined dataset: build each column once at its final length
+        # rather than copying both frames and concatenating them
+        n_t, n_c = len(treatment_data), len(control_data)
+        columns = {
+            'sentiment_mean': np.concatenate([
+                treatment_data['sentiment_mean'].to_numpy(dtype=np.float32),
+                control_data['sentiment_mean'].to_numpy(dtype=np.float32)
+            ]),
+            'treat': np.concatenate([np.ones(n_t, dtype=np.int8), np.zeros(n_c, dtype=np.int8)]),
+            'group': pd.Categorical.from_codes(
+                np.concatenate([np.zeros(n_t, dtype=np.int8), np.ones(n_c, dtype=np.int8)]),
+                categories=['North Korea', control_name]
+            ),
+            'month': np.concatenate([treatment_data['month'].to_numpy(), control_data['month'].to_numpy()])
+        }
+
+        # Use month_date if supplied (weekly data compatibility)
+        if 'month_date' in treatment_data.columns and 'month_date' in control_data.columns:
+            columns['month_date'] = np.concatenate([
+                pd.to_datetime(treatment_data['month_date']).to_numpy(),
+                pd.to_datetime(control_data['month_date']).to_numpy()
+            ])
 
-        self.combined = pd.concat([self.treatment_data, self.control_data], ignore_index=True)
+        self.combined = pd.DataFrame(columns, copy=False)
 
         # Convert month to datetime (if not already present, for weekly data compatibility)
         if 'month_date' not in self.combined.columns:
-            self.combined['month_date'] = pd.to_datetime(self.combined['month'] + '-01')
+            if isinstance(self.combined['month'].dtype, pd.PeriodDtype):
+                self.combined['month_date'] = self.combined['month'].dt.to_timestamp()
+            else:
+                # 'YYYY-MM' strings: period -> timestamp avoids a per-row '-01' concat and parse
+                self.combined['month_date'] = pd.PeriodIndex(self.combined['month'], freq='M').to_timestamp()
 
         # Create post-treatment indicator
         intervention_month = pd.to_datetime(DID_CONFIG['post_period_start'] + '-01')
-        self.combined['post'] = (self.combined['month_date'] >= intervention_month).astype(int)
+        self.combined['post'] = (self.combined['month_date'] >= intervention_month).astype(np.int8)
 
-        # Create time variable
+        # Create time variable (calendar months since the first observation)
         min_month = self.combined['month_date'].min()
-        self.combined['time'] = ((self.combined['month_date'] - min_month) /
-                                 pd.Timedelta(days=30)).astype(int)
+        self.combined['time'] = ((self.combined['month_date'].dt.year - min_month.year) * 12 +
+                                 (self.combined['month_date'].dt.month - min_month.month)).astype(np.int16)
 
     def estimate_basic_did(self) -> dict:
         """
@@ -88,10 +131,10 @@ class DIDAnalyzer:
         print("\n--- ITS-Style DID Model (Slope Change) ---")
         print("Model: sentiment ~ treat + time + post + treat:time + treat:post + treat:time:post")
 
-        model_ols = smf.ols(
-            'sentiment_mean ~ treat + time + post + treat:time + treat:post + treat:time:post',
-            data=data
-        ).fit()
+        # Build the design matrix once; the clustered fit below reuses it
+        model = smf.ols(DID_FORMULA, data=data)
+        model_ols = model.fit()
+        ci_ols = model_ols.conf_int()
 
         # Extract key coefficients
         beta4_pre_trend_diff = model_ols.params['treat:time']
@@ -112,26 +155,26 @@ class DIDAnalyzer:
         print(f"     → Post-intervention SLOPE change (DID estimate)")
         print(f"     → SE: {model_ols.bse['treat:time:post']:.4f}")
         print(f"     → P-value: {model_ols.pvalues['treat:time:post']:.4f}")
-        print(f"     → 95% CI: [{model_ols.conf_int().loc['treat:time:post', 0]:.4f}, {model_ols.conf_int().loc['treat:time:post', 1]:.4f}]")
+        print(f"     → 95% CI: [{ci_ols.loc['treat:time:post', 0]:.4f}, {ci_ols.loc['treat:time:post', 1]:.4f}]")
 
         print(f"\n  Model R²: {model_ols.rsquared:.4f}")
 
         # Fit with clustered standard errors
         print("\n--- Clustered SE (by month) ---")
         try:
-            model_cluster = smf.ols(
-                'sentiment_mean ~ treat + time + post + treat:time + treat:post + treat:time:post',
-                data=data
-            ).fit(
+            # Refitting the same model reuses its design matrix and cached pinv;
+            # only the covariance estimator changes
+            model_cluster = model.fit(
                 cov_type='cluster',
                 cov_kwds={'groups': data['month']}
             )
+            ci_cluster = model_cluster.conf_int()
 
             print(f"\n  β₆ (DID) with Clustered SE:")
             print(f"     Coefficient: {model_cluster.params['treat:time:post']:+.4f}")
             print(f"     SE: {model_cluster.bse['treat:time:post']:.4f}")
             print(f"     P-value: {model_cluster.pvalues['treat:time:post']:.4f}")
-            print(f"     95% CI: [{model_cluster.conf_int().loc['treat:time:post', 0]:.4f}, {model_cluster.conf_int().loc['treat:time:post', 1]:.4f}]")
+            print(f"     95% CI: [{ci_cluster.loc['treat:time:post', 0]:.4f}, {ci_cluster.loc['treat:time:post', 1]:.4f}]")
 
             has_cluster = True
         except Exception as e:
@@ -178,35 +221,83 @@ class DIDAnalyzer:
             'n_control': int(len(data[data['treat'] == 0])),
 
             'ols': {
-                'did_estimate': float(beta6_slope_change),
-                'se': float(model_ols.bse['treat:time:post']),
-                'p_value': float(model_ols.pvalues['treat:time:post']),
-                'ci_lower': float(model_ols.conf_int().loc['treat:time:post', 0]),
-                'ci_upper': float(model_ols.conf_int().loc['treat:time:post', 1]),
-                'r_squared': float(model_ols.rsquared),
-                'beta4_pre_trend_diff': float(beta4_pre_trend_diff),
-                'beta4_pvalue': float(model_ols.pvalues['treat:time']),
-                'beta5_level_change': float(beta5_level_change),
-                'beta5_pvalue': float(model_ols.pvalues['treat:post'])
+                'did_estimate': beta6_slope_change,
+                'se': model_ols.bse['treat:time:post'],
+                'p_value': model_ols.pvalues['treat:time:post'],
+                'ci_lower': ci_ols.loc['treat:time:post', 0],
+                'ci_upper': ci_ols.loc['treat:time:post', 1],
+                'r_squared': model_ols.rsquared,
+                'beta4_pre_trend_diff': beta4_pre_trend_diff,
+                'beta4_pvalue': model_ols.pvalues['treat:time'],
+                'beta5_level_change': beta5_level_change,
+                'beta5_pvalue': model_ols.pvalues['treat:post']
             },
 
             'slopes': {
-                'nk_pre_slope': float(nk_pre_slope),
-                'nk_post_slope': float(nk_post_slope),
-                'nk_slope_change': float(nk_post_slope - nk_pre_slope),
-                'control_pre_slope': float(control_pre_slope),
-                'control_post_slope': float(control_post_slope),
-                'control_slope_change': float(control_post_slope - control_pre_slope)
+                'nk_pre_slope': nk_pre_slope,
+                'nk_post_slope': nk_post_slope,
+                'nk_slope_change': nk_post_slope - nk_pre_slope,
+                'control_pre_slope': control_pre_slope,
+                'control_post_slope': control_post_slope,
+                'control_slope_change': control_post_slope - control_pre_slope
             }
         }
 
         if has_cluster:
             results['clustered'] = {
-                'did_estimate': float(model_cluster.params['treat:time:post']),
-                'se': float(model_cluster.bse['treat:time:post']),
-                'p_value': float(model_cluster.pvalues['treat:time:post']),
-                'ci_lower': float(model_cluster.conf_int().loc['treat:time:post', 0]),
-                'ci_upper': float(model_cluster.conf_int().loc['treat:time:post', 1])
+                'did_estimate': model_cluster.params['treat:time:post'],
+                'se': model_cluster.bse['treat:time:post'],
+                'p_value': model_cluster.pvalues['treat:time:post'],
+                'ci_lower': ci_cluster.loc['treat:time:post', 0],
+                'ci_upper': ci_cluster.loc['treat:time:post', 1]
+            }
+
+        return results
+
+    def bootstrap_did(self, n_boot: int = 1000, seed: int = 42) -> dict:
+        """
+        Cluster bootstrap of the DID coefficients, resampling months with replacement.
+
+        The design matrix is built once from DID_FORMULA; each draw only gathers rows
+        and solves the normal equations (JIT-compiled when numba is available).
+
+        Args:
+            n_boot: Number of bootstrap draws
+            seed: Random seed
+
+        Returns:
+            dict with bootstrap distribution summaries for β₄, β₅ and β₆
+        """
+        data = self.combined.dropna(subset=['sentiment_mean'])
+        y, X = dmatrices(DID_FORMULA, data, return_type='dataframe')
+        columns = list(X.columns)
+        X = np.ascontiguousarray(X.to_numpy(dtype=np.float64))
+        y = np.ascontiguousarray(y.to_numpy(dtype=np.float64).ravel())
+
+        codes, clusters = pd.factorize(data[DID_CONFIG['cluster_level']])
+        rows_by_cluster = [np.flatnonzero(codes == k) for k in range(len(clusters))]
+
+        terms = ['treat:time', 'treat:post', 'treat:time:post']
+        term_idx = [columns.index(t) for t in terms]
+
+        rng = np.random.default_rng(seed)
+        draws = np.full((n_boot, len(terms)), np.nan)
+        for b in range(n_boot):
+            picked = rng.integers(len(rows_by_cluster), size=len(rows_by_cluster))
+            idx = np.concatenate([rows_by_cluster[k] for k in picked])
+            try:
+                draws[b] = _did_fit(X[idx], y[idx])[term_idx]
+            except Exception:
+                # Singular resample (e.g. no post-period months drawn); leave as NaN
+                pass
+
+        results = {'n_boot': n_boot, 'n_failed': int(np.isnan(draws[:, 0]).sum())}
+        for j, key in enumerate(['beta4_pre_trend_diff', 'beta5_level_change', 'did_estimate']):
+            results[key] = {
+                'mean': float(np.nanmean(draws[:, j])),
+                'se': float(np.nanstd(draws[:, j], ddof=1)),
+                'ci_lower': float(np.nanpercentile(draws[:, j], 2.5)),
+                'ci_upper': float(np.nanpercentile(draws[:, j], 97.5))
             }
 
         return results
@@ -216,9 +307,14 @@ class DIDAnalyzer:
         Create DID visualization showing treatment and control trends.
 
         Args:
-            save_path: Path to save figure
+            save_path: Path to save figure (nothing is drawn if omitted)
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
+        if not save_path:
+            return
+
+        # A bare Figure renders to file without pyplot, leaving the process's backend alone
+        fig = Figure(figsize=(14, 7))
+        ax = fig.add_subplot()
 
         intervention_month = pd.to_datetime(DID_CONFIG['post_period_start'] + '-01')
 
@@ -252,14 +348,11 @@ class DIDAnalyzer:
         ax.legend(loc='best', fontsize=11, framealpha=0.95)
         ax.grid(True, alpha=0.3, linestyle='--')
 
-        plt.tight_layout()
-
-        if save_path:
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"\n✓ Saved plot: {save_path}")
+        fig.tight_layout()
 
-        plt.close()
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"\n✓ Saved plot: {save_path}")
 
     def run_full_analysis(self, save_dir: str = 'visualizations') -> dict:
         """
@@ -282,29 +375,37 @@ class DIDAnalyzer:
         os.makedirs('data/results', exist_ok=True)
         results_path = f'data/results/did_{self.control_name.lower()}_results.json'
 
-        with open(results_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(results_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
         print(f"\n✓ Results saved: {results_path}")
 
         return results
 
 
-def run_did_analysis():
-    """Run DID analysis with Iran as control group."""
+def run_did_analysis(control_name='Iran', control_csv_path='data/processed/iran_monthly.csv'):
+    """Run DID analysis against a single control group.
+
+    Args:
+        control_name: Name of the control country
+        control_csv_path: Path to the control group's monthly CSV
+
+    Returns:
+        Results dictionary from DIDAnalyzer.run_full_analysis
+    """
     print("="*60)
-    print("PHASE 4: DID ESTIMATION")
+    print(f"PHASE 4: DID ESTIMATION ({control_name})")
     print("="*60)
 
     # Load data
     nk_monthly = pd.read_csv('data/processed/nk_monthly.csv')
-    iran_monthly = pd.read_csv('data/processed/iran_monthly.csv')
+    control_monthly = pd.read_csv(control_csv_path)
 
     print(f"\nLoaded NK data: {nk_monthly['post_count'].notna().sum()} months")
-    print(f"Loaded Iran data: {iran_monthly['post_count'].notna().sum()} months")
+    print(f"Loaded {control_name} data: {control_monthly['post_count'].notna().sum()} months")
 
     # Run DID analysis
-    analyzer = DIDAnalyzer(nk_monthly, iran_monthly, control_name='Iran')
+    analyzer = DIDAnalyzer(nk_monthly, control_monthly, control_name=control_name)
     results = analyzer.run_full_analysis()
 
     # Interpretation
@@ -331,13 +432,36 @@ def run_did_analysis():
 
     if did_estimate > 0:
         print(f"\nThe summit announcement improved NK sentiment by {did_estimate:.4f} points")
-        print(f"relative to Iran (counterfactual baseline).")
+        print(f"relative to {control_name} (counterfactual baseline).")
     else:
         print(f"\nThe summit announcement decreased NK sentiment by {abs(did_estimate):.4f} points")
-        print(f"relative to Iran (counterfactual baseline).")
+        print(f"relative to {control_name} (counterfactual baseline).")
 
     return results
 
 
+def run_all_did(max_workers=3):
+    """Run the DID analysis for every control group in parallel.
+
+    Each control is independent (own CSV, own fit, own figure), so the
+    analyses run in separate processes.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Returns:
+        Dictionary mapping control name to its results
+    """
+    controls = [
+        ('Iran', 'data/processed/iran_monthly.csv'),
+        ('China', 'data/processed/china_monthly.csv'),
+        ('Russia', 'data/processed/russia_monthly.csv'),
+    ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(run_did_analysis, name, path) for name, path in controls}
+        return {name: future.result() for name, future in futures.items()}
+
+
 if __name__ == '__main__':
     run_did_analysis()
@@ -0,0 +1,167 @@
+"""
+Distilled Local Framing Classifier
+
+Small transformer classifier fine-tuned on framing labels produced by
+OpenAIFramingAnalyzer (the labeler of record). Once trained, it classifies the
+bulk corpus locally instead of making one API call per post.
+Categories: THREAT, DIPLOMACY, NEUTRAL, ECONOMIC, HUMANITARIAN
+"""
+
+import pandas as pd
+import numpy as np
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from tqdm import tqdm
+
+from config import FRAME_CATEGORIES, DISTILLED_FRAMING_DIR, DISTILLED_BASE_MODEL
+
+
+def _post_texts(df: pd.DataFrame, title_col: str, body_col: str) -> list:
+    """Join title and body into the single text the classifier sees."""
+    titles = df[title_col].fillna('').astype(str)
+    bodies = df[body_col].fillna('').astype(str)
+    return (titles + "\n" + bodies).tolist()
+
+
+def distill_from_labels(
+    df: pd.DataFrame,
+    title_col: str = 'title',
+    body_col: str = 'selftext',
+    label_col: str = 'frame',
+    output_dir=DISTILLED_FRAMING_DIR,
+    base_model: str = DISTILLED_BASE_MODEL,
+    epochs: int = 3,
+    batch_size: int = 32,
+    learning_rate: float = 5e-5,
+    max_length: int = 256
+) -> None:
+    """
+    Fine-tune a sequence classifier on LLM framing labels and save it.
+
+    Args:
+        df: DataFrame with title, body and label columns (e.g. the first
+            1-2k posts classified by OpenAIFramingAnalyzer)
+        title_col: Name of title column
+        body_col: Name of body column
+        label_col: Name of the frame label column
+        output_dir: Directory to save the fine-tuned model and tokenizer
+        base_model: HuggingFace model to start from
+        epochs: Number of training epochs
+        batch_size: Training batch size
+        learning_rate: AdamW learning rate
+        max_length: Maximum tokens per post
+    """
+    df = df[df[label_col].isin(FRAME_CATEGORIES)]
+    texts = _post_texts(df, title_col, body_col)
+    labels = torch.tensor(df[label_col].map({f: i for i, f in enumerate(FRAME_CATEGORIES)}).to_numpy())
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    tokenizer = AutoTokenizer.from_pretrained(base_model)
+    model = AutoModelForSequenceClassification.from_pretrained(
+        base_model,
+        num_labels=len(FRAME_CATEGORIES),
+        id2label=dict(enumerate(FRAME_CATEGORIES)),
+        label2id={f: i for i, f in enumerate(FRAME_CATEGORIES)}
+    ).to(device)
+
+    encodings = tokenizer(texts, truncation=True, max_length=max_length, padding=True, return_tensors="pt")
+    optimizer = torch.optim.AdamW(model.parameters(), lr=learning_rate)
+    rng = np.random.default_rng(42)
+
+    print(f"Distilling {len(texts)} labeled posts into {base_model} ({device})...")
+    model.train()
+    for epoch in range(epochs):
+        order = rng.permutation(len(texts))
+        total_loss = 0.0
+        for start in tqdm(range(0, len(order), batch_size), desc=f"Epoch {epoch + 1}/{epochs}"):
+            idx = torch.from_numpy(order[start:start + batch_size])
+            batch = {k: v[idx].to(device) for k, v in encodings.items()}
+            loss = model(**batch, labels=labels[idx].to(device)).loss
+            loss.backward()
+            optimizer.step()
+            optimizer.zero_grad()
+            total_loss += loss.item() * len(idx)
+        print(f"  Epoch {epoch + 1}: mean loss {total_loss / len(texts):.4f}")
+
+    model.save_pretrained(output_dir)
+    tokenizer.save_pretrained(output_dir)
+    print(f"✓ Saved distilled model: {output_dir}")
+
+
+class DistilledFramingAnalyzer:
+    """Local transformer framing classifier distilled from OpenAI labels."""
+
+    def __init__(self, model_dir=DISTILLED_FRAMING_DIR, batch_size: int = 32, max_length: int = 256):
+        """
+        Initialize the distilled framing analyzer.
+
+        Args:
+            model_dir: Directory written by distill_from_labels
+            batch_size: Posts per forward pass
+            max_length: Maximum tokens per post
+        """
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_dir).to(self.device).eval()
+        if self.device == "cuda":
+            self.model = self.model.half()
+
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.labels = [self.model.config.id2label[i] for i in range(self.model.config.num_labels)]
+
+    def classify_texts(self, texts: list) -> tuple:
+        """
+        Classify texts in batches.
+
+        Args:
+            texts: List of post texts
+
+        Returns:
+            (list of frame labels, array of confidences)
+        """
+        frames, confidences = [], []
+
+        with torch.inference_mode():
+            for start in tqdm(range(0, len(texts), self.batch_size), desc="Distilled Framing"):
+                batch = self.tokenizer(
+                    texts[start:start + self.batch_size],
+                    truncation=True,
+                    max_length=self.max_length,
+                    padding=True,
+                    return_tensors="pt"
+                ).to(self.device)
+                probs = torch.softmax(self.model(**batch).logits.float(), dim=-1)
+                conf, pred = probs.max(dim=-1)
+                frames.extend(self.labels[i] for i in pred.tolist())
+                confidences.append(conf.cpu().numpy())
+
+        return frames, np.concatenate(confidences) if confidences else np.array([])
+
+    def analyze_dataframe(
+        self,
+        df: pd.DataFrame,
+        title_col: str = 'title',
+        body_col: str = 'selftext'
+    ) -> pd.DataFrame:
+        """
+        Classify framing for posts in a DataFrame.
+
+        Args:
+            df: DataFrame with title and body columns
+            title_col: Name of title column
+            body_col: Name of body column
+
+        Returns:
+            DataFrame with framing results added (same columns as OpenAIFramingAnalyzer)
+        """
+        print(f"Classifying {len(df)} posts with distilled model ({self.device})...")
+        frames, confidences = self.classify_texts(_post_texts(df, title_col, body_col))
+
+        framed = pd.DataFrame({
+            'frame': frames,
+            'frame_confidence': confidences,
+            'frame_reason': 'distilled classifier'
+        }, index=df.index)
+
+        return pd.concat([df.drop(columns=framed.columns, errors='ignore'), framed], axis=1, copy=False)
@@ -7,12 +7,46 @@ of the summit announcement on public sentiment.
 
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
+from scipy import stats
 from datetime import datetime
 import json
 
 from config import INTERVENTION_DATE, RESULTS_DIR
 
+try:
+    from numba import njit
+
+    @njit(cache=True, nogil=True)
+    def _bucket_moments(codes, values, n_buckets):
+        """Per-bucket count, mean and sample std (two-pass), skipping NaN values."""
+        sums = np.zeros(n_buckets)
+        counts = np.zeros(n_buckets, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            if not np.isnan(values[i]):
+                sums[codes[i]] += values[i]
+                counts[codes[i]] += 1
+        means = sums / counts
+
+        sq_dev = np.zeros(n_buckets)
+        for i in range(codes.shape[0]):
+            if not np.isnan(values[i]):
+                d = values[i] - means[codes[i]]
+                sq_dev[codes[i]] += d * d
+        stds = np.sqrt(sq_dev / (counts - 1))
+        return means, stds, counts
+
+except ImportError:  # numba is optional; bincount computes the same moments in C
+    def _bucket_moments(codes, values, n_buckets):
+        """Per-bucket count, mean and sample std (two-pass), skipping NaN values."""
+        ok = ~np.isnan(values)
+        codes, values = codes[ok], values[ok]
+        counts = np.bincount(codes, minlength=n_buckets)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.bincount(codes, weights=values, minlength=n_buckets) / counts
+            sq_dev = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_buckets)
+            stds = np.sqrt(sq_dev / (counts - 1))
+        return means, stds, counts
+
 
 class ITSAnalyzer:
     """Interrupted Time Series analyzer for causal inference."""
@@ -39,19 +73,34 @@ class ITSAnalyzer:
         Returns:
             Monthly aggregated DataFrame
         """
-        df = df.copy()
-        df['date'] = pd.to_datetime(df[date_column], unit='s')
-        df['month'] = df['date'].dt.to_period('M')
-
-        monthly = df.groupby('month').agg({
-            sentiment_column: ['mean', 'std', 'count']
-        }).reset_index()
-
-        monthly.columns = ['month', 'sentiment_mean', 'sentiment_std', 'count']
-        monthly['month_date'] = monthly['month'].dt.to_timestamp()
+        # Month buckets straight from epoch seconds via datetime64[M], skipping
+        # per-row Timestamp/Period construction; rows without a timestamp are dropped
+        seconds = df[date_column].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(seconds)
+        buckets = (seconds[valid].astype(np.int64).astype('datetime64[s]')
+                   .astype('datetime64[M]').astype('datetime64[ns]'))
+        values = df[sentiment_column].to_numpy(dtype=np.float64)[valid]
+
+        # Mean / std / count per month from a compiled kernel over integer month codes
+        uniques, codes = np.unique(buckets, return_inverse=True)
+        means, stds, counts = _bucket_moments(codes.astype(np.int64), values, len(uniques))
+
+        # Period labels are rebuilt once per month, not once per row
+        month_date = pd.DatetimeIndex(uniques)
+        monthly = pd.DataFrame({
+            'month': pd.PeriodIndex(month_date, freq='M'),
+            'sentiment_mean': means,
+            'sentiment_std': stds,
+            'count': counts,
+            'month_date': month_date
+        })
 
         return monthly
 
+    def _post_mask(self, monthly_data: pd.DataFrame) -> np.ndarray:
+        """Boolean array marking months on or after the intervention date."""
+        return monthly_data['month_date'].to_numpy() >= np.datetime64(self.intervention_date)
+
     def fit_its_model(self, monthly_data: pd.DataFrame) -> dict:
         """
         Fit the ITS regression model.
@@ -71,55 +120,63 @@ class ITSAnalyzer:
         Returns:
             Dictionary with model results
         """
-        df = monthly_data.copy()
-
         # Create ITS variables
-        df['time'] = range(1, len(df) + 1)
-        df['intervention'] = (df['month_date'] >= self.intervention_date).astype(int)
-        df['time_after'] = df['time'] * df['intervention']
-
-        # Fit OLS model
-        X = sm.add_constant(df[['time', 'intervention', 'time_after']])
-        y = df['sentiment_mean']
-
-        model = sm.OLS(y, X).fit()
-
-        # Extract coefficients
+        n = len(monthly_data)
+        time = np.arange(1, n + 1, dtype=np.float64)
+        intervention = self._post_mask(monthly_data).astype(np.float64)
+        time_after = time * intervention
+
+        # Fit OLS directly; only coefficients, SEs, t/p and fit statistics are reported
+        X = np.column_stack([np.ones(n), time, intervention, time_after])
+        y = monthly_data['sentiment_mean'].to_numpy(dtype=np.float64)
+        k = X.shape[1]
+        df_resid = n - k
+
+        beta, _, _, _ = np.linalg.lstsq(X, y, rcond=None)
+        resid = y - X @ beta
+        ssr = float(resid @ resid)
+        centered_tss = float(((y - y.mean()) ** 2).sum())
+
+        sigma2 = ssr / df_resid
+        bse = np.sqrt(np.diag(sigma2 * np.linalg.pinv(X.T @ X)))
+        tvalues = beta / bse
+        pvalues = 2 * stats.t.sf(np.abs(tvalues), df_resid)
+
+        rsquared = 1 - ssr / centered_tss
+        rsquared_adj = 1 - (1 - rsquared) * (n - 1) / df_resid
+        fvalue = ((centered_tss - ssr) / (k - 1)) / sigma2
+        f_pvalue = stats.f.sf(fvalue, k - 1, df_resid)
+
+        def coefficient(i: int) -> dict:
+            return {
+                "estimate": float(beta[i]),
+                "std_error": float(bse[i]),
+                "t_stat": float(tvalues[i]),
+                "p_value": float(pvalues[i])
+            }
+
+        # Extract coefficients (columns: const, time, intervention, time_after)
         results = {
             "coefficients": {
-                "intercept": {
-                    "estimate": float(model.params['const']),
-                    "std_error": float(model.bse['const']),
-                    "t_stat": float(model.tvalues['const']),
-                    "p_value": float(model.pvalues['const'])
-                },
+                "intercept": coefficient(0),
                 "beta1_pre_trend": {
-                    "estimate": float(model.params['time']),
-                    "std_error": float(model.bse['time']),
-                    "t_stat": float(model.tvalues['time']),
-                    "p_value": float(model.pvalues['time']),
+                    **coefficient(1),
                     "interpretation": "Pre-intervention slope (natural trend)"
                 },
                 "beta2_level_change": {
-                    "estimate": float(model.params['intervention']),
-                    "std_error": float(model.bse['intervention']),
-                    "t_stat": float(model.tvalues['intervention']),
-                    "p_value": float(model.pvalues['intervention']),
+                    **coefficient(2),
                     "interpretation": "Immediate effect at intervention"
                 },
                 "beta3_slope_change": {
-                    "estimate": float(model.params['time_after']),
-                    "std_error": float(model.bse['time_after']),
-                    "t_stat": float(model.tvalues['time_after']),
-                    "p_value": float(model.pvalues['time_after']),
+                    **coefficient(3),
                     "interpretation": "Change in trend post-intervention"
                 }
             },
             "model_fit": {
-                "r_squared": float(model.rsquared),
-                "adj_r_squared": float(model.rsquared_adj),
-                "f_statistic": float(model.fvalue),
-                "f_p_value": float(model.f_pvalue)
+                "r_squared": float(rsquared),
+                "adj_r_squared": float(rsquared_adj),
+                "f_statistic": float(fvalue),
+                "f_p_value": float(f_pvalue)
             },
             "intervention_date": str(self.intervention_date.date())
         }
@@ -137,11 +194,12 @@ class ITSAnalyzer:
         Returns:
             Dictionary with counterfactual analysis
         """
-        df = monthly_data.copy()
-        df['month_date'] = pd.to_datetime(df['month_date'])
+        # month_date comes out of prepare_monthly_data already as datetime64
+        df = monthly_data
+        assert pd.api.types.is_datetime64_any_dtype(df['month_date'])
 
         # Get post-intervention data
-        post_data = df[df['month_date'] >= self.intervention_date]
+        post_data = df[self._post_mask(df)]
 
         if len(post_data) == 0:
             return {"error": "No post-intervention data available"}
@@ -151,15 +209,13 @@ class ITSAnalyzer:
         beta1 = model_results['coefficients']['beta1_pre_trend']['estimate']
 
         # Calculate counterfactual (extend pre-intervention trend)
-        time_values = range(1, len(df) + 1)
         post_time_start = len(df) - len(post_data) + 1
 
-        counterfactual_values = []
-        for t in range(post_time_start, len(df) + 1):
-            counterfactual_values.append(beta0 + beta1 * t)
+        t = np.arange(post_time_start, len(df) + 1, dtype=np.float64)
+        counterfactual_values = beta0 + beta1 * t
 
-        actual_mean = post_data['sentiment_mean'].mean()
-        counterfactual_mean = np.mean(counterfactual_values)
+        actual_mean = float(np.nanmean(post_data['sentiment_mean'].to_numpy(dtype=np.float64)))
+        counterfactual_mean = float(counterfactual_values.mean())
         causal_effect = actual_mean - counterfactual_mean
 
         return {
@@ -8,13 +8,50 @@ between treatment (NK) and control (Iran/Russia/China) groups.
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import statsmodels.formula.api as smf
+from scipy.linalg import qr, solve_triangular, cho_factor, cho_solve
+from scipy.stats import t as student_t
 import seaborn as sns
 import os
 import json
 
 from src.config import DID_CONFIG
 
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _did_ols(y, t, g, tg):
+        """OLS of y on [1, t, g, t*g]: normal equations in one pass, then the RSS."""
+        xtx = np.zeros((4, 4))
+        xty = np.zeros(4)
+        x = np.empty(4)
+        for i in range(y.shape[0]):
+            x[0] = 1.0
+            x[1] = t[i]
+            x[2] = g[i]
+            x[3] = tg[i]
+            for a in range(4):
+                xty[a] += x[a] * y[i]
+                for b in range(4):
+                    xtx[a, b] += x[a] * x[b]
+        beta = np.linalg.solve(xtx, xty)
+
+        rss = 0.0
+        for i in range(y.shape[0]):
+            r = y[i] - (beta[0] + beta[1] * t[i] + beta[2] * g[i] + beta[3] * tg[i])
+            rss += r * r
+        return beta, rss, xtx
+
+except ImportError:  # numba is optional; fall back to an economic QR solve
+    def _did_ols(y, t, g, tg):
+        """OLS of y on [1, t, g, t*g] via QR; returns the RSS and X'X as well."""
+        X = np.column_stack([np.ones_like(t), t, g, tg])
+        Q, R = qr(X, mode='economic')
+        beta = solve_triangular(R, Q.T @ y)
+        xtx = R.T @ R
+        resid = y - X @ beta
+        return beta, float(resid @ resid), xtx
+
 
 class ParallelTrendsTest:
     """Test parallel trends assumption for DID analysis."""
@@ -28,27 +65,33 @@ class ParallelTrendsTest:
             control_data: Control group monthly sentiment data
             control_name: Name of control group (e.g., 'Iran')
         """
-        self.nk_data = nk_data.copy()
-        self.control_data = control_data.copy()
         self.control_name = control_name
 
-        # Prepare combined dataset
-        self.nk_data['treat'] = 1
-        self.nk_data['group'] = 'North Korea'
-        self.control_data['treat'] = 0
-        self.control_data['group'] = control_name
+        # Prepare combined dataset; only the concatenated frame is kept
+        self.combined = pd.concat([
+            nk_data.assign(treat=1, group='North Korea'),
+            control_data.assign(treat=0, group=control_name)
+        ], ignore_index=True, copy=False)
+        self.combined['month'] = pd.to_datetime(self.combined['month'], format='%Y-%m', cache=True)
 
-        self.combined = pd.concat([self.nk_data, self.control_data], ignore_index=True)
-        self.combined['month'] = pd.to_datetime(self.combined['month'] + '-01')
+        # Row masks per group, computed once; self.combined is not modified after this
+        groups = self.combined['group'].to_numpy()
+        self._masks = {
+            'North Korea': groups == 'North Korea',
+            control_name: groups == control_name
+        }
 
         # Filter pre-intervention period
-        pre_end = pd.to_datetime(DID_CONFIG['pre_period_end'] + '-01')
-        self.pre_period = self.combined[self.combined['month'] <= pre_end].copy()
+        pre_end = pd.to_datetime(DID_CONFIG['pre_period_end'], format='%Y-%m')
+        pre_period = self.combined[self.combined['month'] <= pre_end]
+
+        # Create time variable (whole months since start)
+        month = pre_period['month']
+        min_month = month.min()
+        time = (month.dt.year - min_month.year) * 12 + month.dt.month - min_month.month
 
-        # Create time variable (months since start)
-        min_month = self.pre_period['month'].min()
-        self.pre_period['time'] = ((self.pre_period['month'] - min_month) /
-                                    pd.Timedelta(days=30)).astype(int)
+        # Interaction term materialized once for every test on this panel
+        self.pre_period = pre_period.assign(time=time, time_x_treat=time * pre_period['treat'])
 
     def test_parallel_trends(self) -> dict:
         """
@@ -73,17 +116,25 @@ class ParallelTrendsTest:
                 'message': f'Insufficient data for testing ({len(test_data)} observations)'
             }
 
-        # Fit regression model
+        # Fit regression model on a direct design matrix [1, time, treat, time*treat]
         try:
-            model = smf.ols('sentiment_mean ~ time + treat + time:treat', data=test_data).fit()
+            y = test_data['sentiment_mean'].to_numpy(dtype=np.float64)
+            t = test_data['time'].to_numpy(dtype=np.float64)
+            g = test_data['treat'].to_numpy(dtype=np.float64)
+            tg = test_data['time_x_treat'].to_numpy(dtype=np.float64)
+            n, k = len(y), 4
+
+            beta, rss, xtx = _did_ols(y, t, g, tg)
+            sigma2 = rss / (n - k)
+            var_beta = sigma2 * cho_solve(cho_factor(xtx), np.eye(k))
 
             # Extract interaction coefficient
-            interaction_coef = model.params['time:treat']
-            interaction_pval = model.pvalues['time:treat']
+            interaction_coef = beta[3]
+            interaction_pval = 2 * student_t.sf(abs(beta[3]) / np.sqrt(var_beta[3, 3]), n - k)
 
             # Calculate individual slopes
-            nk_slope = model.params['time'] + interaction_coef  # NK slope
-            control_slope = model.params['time']  # Control slope
+            nk_slope = beta[1] + interaction_coef  # NK slope
+            control_slope = beta[1]  # Control slope
 
             # Determine verdict
             threshold = DID_CONFIG['parallel_trends_threshold']
@@ -98,8 +149,8 @@ class ParallelTrendsTest:
                 'slope_difference': float(abs(nk_slope - control_slope)),
                 'threshold': threshold,
                 'model_summary': {
-                    'r_squared': float(model.rsquared),
-                    'n_obs': int(model.nobs)
+                    'r_squared': float(1 - rss / ((y - y.mean()) ** 2).sum()),
+                    'n_obs': int(n)
                 }
             }
         except Exception as e:
@@ -122,13 +173,16 @@ class ParallelTrendsTest:
         # Get intervention month
         intervention_month = pd.to_datetime(DID_CONFIG['post_period_start'] + '-01')
 
+        has_sentiment = self.combined['sentiment_mean'].notna().to_numpy()
+
         # Plot data
         for group_name in ['North Korea', self.control_name]:
-            group_data = self.combined[self.combined['group'] == group_name].dropna(subset=['sentiment_mean'])
+            # Cached group mask; with months sorted, pre/post is one binary search
+            group_data = self.combined[self._masks[group_name] & has_sentiment].sort_values('month', kind='stable')
 
             # Separate pre and post
-            pre_data = group_data[group_data['month'] < intervention_month]
-            post_data = group_data[group_data['month'] >= intervention_month]
+            split = group_data['month'].searchsorted(intervention_month)
+            pre_data, post_data = group_data.iloc[:split], group_data.iloc[split:]
 
             # Plot pre-intervention (solid line)
             ax.plot(pre_data['month'], pre_data['sentiment_mean'],
@@ -248,21 +302,16 @@ def run_all_parallel_trends_tests():
     os.makedirs('data/results', exist_ok=True)
     results_path = 'data/results/parallel_trends_tests.json'
 
-    # Convert numpy types to native Python for JSON serialization
-    def convert_types(obj):
-        if isinstance(obj, dict):
-            return {k: convert_types(v) for k, v in obj.items()}
-        elif isinstance(obj, (np.integer, np.floating)):
+    # json calls this only for values it cannot encode itself (numpy scalars/arrays)
+    def _np_default(obj):
+        if isinstance(obj, (np.integer, np.floating)):
             return float(obj)
-        elif isinstance(obj, np.ndarray):
+        if isinstance(obj, np.ndarray):
             return obj.tolist()
-        else:
-            return obj
-
-    all_results = convert_types(all_results)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
     with open(results_path, 'w') as f:
-        json.dump(all_results, f, indent=2)
+        json.dump(all_results, f, indent=2, default=_np_default)
 
     print(f"\n{'='*60}")
     print(f"SUMMARY")
@@ -39,8 +39,8 @@ def run_sentiment_analysis():
     analyzer = SentimentAnalyzer()
 
     # Prepare text
-    p1['text'] = p1['title'].fillna('') + ' ' + p1['selftext'].fillna('')
-    p2['text'] = p2['title'].fillna('') + ' ' + p2['selftext'].fillna('')
+    p1['text'] = p1['title'].fillna('').str.cat(p1['selftext'].fillna(''), sep=' ')
+    p2['text'] = p2['title'].fillna('').str.cat(p2['selftext'].fillna(''), sep=' ')
 
     # Analyze
     p1 = analyzer.analyze_dataframe(p1, 'text')
@@ -7,36 +7,130 @@ Sentiment scores range from -1 (very negative) to +1 (very positive).
 
 import pandas as pd
 import numpy as np
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from scipy import stats
 from tqdm import tqdm
+import sys
+import copy
 import warnings
 warnings.filterwarnings('ignore')
 
 from src.config import SENTIMENT_MODEL, SAMPLE_DIR, RESULTS_DIR
+from src.sentiment_cache import get_or_compute
+
+# Reduced-precision weights are kept only if their star labels match FP32 on at
+# least this share of a sample of the first texts scored
+PRECISION_CHECK_SIZE = 64
+MIN_PRECISION_AGREEMENT = 0.99
+
+
+def native_bf16_supported() -> bool:
+    """True if the CPU executes BF16 natively (AVX512_BF16); False when unknown."""
+    check = getattr(torch.cpu, '_is_avx512_bf16_supported', None)
+    return bool(check()) if check is not None else False
 
 
 class SentimentAnalyzer:
     """BERT-based sentiment analyzer for text data."""
 
-    def __init__(self, model_name: str = SENTIMENT_MODEL):
+    def __init__(self, model_name: str = SENTIMENT_MODEL, use_cache: bool = True, bf16: bool = None):
         """
         Initialize the sentiment analyzer.
 
         Args:
             model_name: HuggingFace model name for sentiment analysis
+            use_cache: Reuse scores stored on disk for previously scored texts
+            bf16: Run on CPU in BF16. None (default) enables it only when the CPU
+                supports BF16 natively; elsewhere it is emulated and slower than FP32
         """
         print(f"Loading sentiment model: {model_name}")
+        self.model_name = model_name
+        self.use_cache = use_cache
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-        self.pipeline = pipeline(
-            "sentiment-analysis",
-            model=self.model,
-            tokenizer=self.tokenizer,
-            truncation=True,
-            max_length=512
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+
+        # Half-precision weights: FP16 on GPU, BF16 on CPUs with native BF16 support.
+        # The FP32 model is kept until the labels have been checked against it once
+        self._fp32_model = None
+        if bf16 is None:
+            bf16 = native_bf16_supported()
+        if torch.cuda.is_available():
+            self._fp32_model = self.model
+            self.model = copy.deepcopy(self.model).to("cuda").half()
+        elif bf16:
+            self._fp32_model = self.model
+            self.model = copy.deepcopy(self.model).to(torch.bfloat16)
+
+        # Star rating per output logit, read from the "N star(s)" labels
+        self.id2star = np.array(
+            [int(self.model.config.id2label[i].split()[0]) for i in range(self.model.config.num_labels)]
+        )
+        print(f"Model loaded successfully! ({self.model.device}, {self.model.dtype})")
+
+    def _score_encoded(self, inputs) -> np.ndarray:
+        """Forward an already padded batch; returns -1 to +1 scores."""
+        with torch.inference_mode():
+            pred = self.model(**inputs.to(self.model.device)).logits.argmax(dim=-1).cpu().numpy()
+        # Convert 1-5 star rating to -1 to +1 scale
+        return (self.id2star[pred] - 3) / 2
+
+    def _check_precision(self, texts: list) -> None:
+        """
+        Compare reduced-precision star labels with FP32 on a sample, once.
+
+        Falls back to the FP32 model if they agree on fewer than
+        MIN_PRECISION_AGREEMENT of the sample.
+        """
+        if self._fp32_model is None or not texts:
+            return
+
+        reference, self._fp32_model = self._fp32_model, None
+        inputs = self.tokenizer(texts[:PRECISION_CHECK_SIZE], truncation=True, max_length=512,
+                                padding=True, return_tensors="pt")
+        with torch.inference_mode():
+            expected = reference(**inputs).logits.argmax(dim=-1).numpy()
+            actual = self.model(**inputs.to(self.model.device)).logits.argmax(dim=-1).cpu().numpy()
+
+        agreement = float((expected == actual).mean())
+        print(f"{self.model.dtype} labels match FP32 on {agreement:.1%} of {len(expected)} texts")
+        if agreement < MIN_PRECISION_AGREEMENT:
+            print("Falling back to FP32")
+            self.model = reference.to(self.model.device)
+
+    def _score_batch(self, texts: list) -> np.ndarray:
+        """Tokenize and forward a batch of non-empty texts; returns -1 to +1 scores."""
+        return self._score_encoded(
+            self.tokenizer(texts, truncation=True, max_length=512, padding=True, return_tensors="pt")
         )
-        print("Model loaded successfully!")
+
+    def _score_texts(self, texts: list, batch_size: int) -> np.ndarray:
+        """
+        Score many texts in length-sorted batches.
+
+        Texts are tokenized once without padding and batched in order of token
+        length, so each batch is only padded to its own longest member instead of
+        to the longest text overall. Scores are returned in input order.
+        """
+        if not texts:
+            return np.array([])
+
+        encodings = self.tokenizer(texts, truncation=True, max_length=512)
+        lengths = np.fromiter(map(len, encodings['input_ids']), dtype=np.int64, count=len(texts))
+        order = np.argsort(lengths, kind='stable')
+
+        scores = np.empty(len(texts))
+        n_batches = -(-len(order) // batch_size)
+        for start in tqdm(range(0, len(order), batch_size), desc="Sentiment Analysis",
+                          miniters=max(1, n_batches // 200), mininterval=0.5, smoothing=0.1,
+                          disable=not sys.stderr.isatty()):
+            idx = order[start:start + batch_size]
+            batch = self.tokenizer.pad(
+                {key: [values[i] for i in idx] for key, values in encodings.items()},
+                return_tensors="pt"
+            )
+            scores[idx] = self._score_encoded(batch)
+        return scores
 
     def analyze_text(self, text: str) -> float:
         """
@@ -52,20 +146,19 @@ class SentimentAnalyzer:
             return 0.0
 
         try:
-            result = self.pipeline(str(text)[:512])[0]
-            # Convert 1-5 star rating to -1 to +1 scale
-            star = int(result['label'].split()[0])
-            return (star - 3) / 2
+            return float(self._score_batch([str(text)[:512]])[0])
         except Exception as e:
             return 0.0
 
-    def analyze_dataframe(self, df: pd.DataFrame, text_column: str = 'text') -> pd.DataFrame:
+    def analyze_dataframe(self, df: pd.DataFrame, text_column: str = 'text',
+                          batch_size: int = 64) -> pd.DataFrame:
         """
         Analyze sentiment for all rows in a DataFrame.
 
         Args:
             df: DataFrame containing text data
             text_column: Name of the column containing text
+            batch_size: Number of texts per forward pass
 
         Returns:
             DataFrame with added 'sentiment_score' column
@@ -73,10 +166,24 @@ class SentimentAnalyzer:
         df = df.copy()
 
         print(f"Analyzing sentiment for {len(df)} texts...")
-        sentiments = []
 
-        for text in tqdm(df[text_column], desc="Sentiment Analysis"):
-            sentiments.append(self.analyze_text(text))
+        # Empty / missing texts score 0.0 without touching the model, as in analyze_text
+        texts = df[text_column].fillna('').astype(str)
+        has_text = texts.str.strip().str.len().to_numpy() > 0
+        batch_texts = texts[has_text].str[:512].tolist()
+
+        def score_all(to_score: list) -> np.ndarray:
+            return self._score_texts(to_score, batch_size)
+
+        self._check_precision(batch_texts)
+
+        sentiments = np.zeros(len(df))
+        if self.use_cache:
+            # Scores from different precisions are kept apart in the cache
+            namespace = f"{self.model_name}|{self.model.dtype}"
+            sentiments[has_text] = get_or_compute(batch_texts, score_all, namespace=namespace)
+        else:
+            sentiments[has_text] = score_all(batch_texts)
 
         df['sentiment_score'] = sentiments
         return df
@@ -93,32 +200,37 @@ def compare_periods(period1_scores: np.ndarray, period2_scores: np.ndarray) -> d
     Returns:
         Dictionary containing statistical test results
     """
-    # T-test
-    t_stat, t_pvalue = stats.ttest_ind(period1_scores, period2_scores)
+    p1 = np.ascontiguousarray(period1_scores, dtype=np.float64)
+    p2 = np.ascontiguousarray(period2_scores, dtype=np.float64)
+
+    # Summary statistics, one pass each, reused below
+    m1, v1, n1 = p1.mean(), p1.var(ddof=1), p1.size
+    m2, v2, n2 = p2.mean(), p2.var(ddof=1), p2.size
+    dof = n1 + n2 - 2
+    pooled_std = np.sqrt(((n1 - 1) * v1 + (n2 - 1) * v2) / dof)
+
+    # T-test (Student, equal variances; same statistic as stats.ttest_ind)
+    t_stat = (m1 - m2) / (pooled_std * np.sqrt(1 / n1 + 1 / n2))
+    t_pvalue = 2 * stats.t.sf(abs(t_stat), dof)
 
     # Mann-Whitney U test (non-parametric)
-    u_stat, u_pvalue = stats.mannwhitneyu(period1_scores, period2_scores, alternative='two-sided')
+    u_stat, u_pvalue = stats.mannwhitneyu(p1, p2, alternative='two-sided')
 
     # Cohen's d (effect size)
-    pooled_std = np.sqrt(
-        ((len(period1_scores) - 1) * np.std(period1_scores, ddof=1)**2 +
-         (len(period2_scores) - 1) * np.std(period2_scores, ddof=1)**2) /
-        (len(period1_scores) + len(period2_scores) - 2)
-    )
-    cohens_d = (np.mean(period2_scores) - np.mean(period1_scores)) / pooled_std
+    cohens_d = (m2 - m1) / pooled_std
 
     return {
         "period1": {
-            "mean": float(np.mean(period1_scores)),
-            "std": float(np.std(period1_scores)),
-            "n": len(period1_scores)
+            "mean": float(m1),
+            "std": float(np.sqrt(v1 * (n1 - 1) / n1)),
+            "n": n1
         },
         "period2": {
-            "mean": float(np.mean(period2_scores)),
-            "std": float(np.std(period2_scores)),
-            "n": len(period2_scores)
+            "mean": float(m2),
+            "std": float(np.sqrt(v2 * (n2 - 1) / n2)),
+            "n": n2
         },
-        "change": float(np.mean(period2_scores) - np.mean(period1_scores)),
+        "change": float(m2 - m1),
         "t_test": {
             "statistic": float(t_stat),
             "p_value": float(t_pvalue)
@@ -163,8 +275,8 @@ if __name__ == "__main__":
     analyzer = SentimentAnalyzer()
 
     # Analyze (using title + selftext as text)
-    p1['text'] = p1['title'].fillna('') + ' ' + p1['selftext'].fillna('')
-    p2['text'] = p2['title'].fillna('') + ' ' + p2['selftext'].fillna('')
+    p1['text'] = p1['title'].fillna('').str.cat(p1['selftext'].fillna(''), sep=' ')
+    p2['text'] = p2['title'].fillna('').str.cat(p2['selftext'].fillna(''), sep=' ')
 
     p1 = analyzer.analyze_dataframe(p1, 'text')
     p2 = analyzer.analyze_dataframe(p2, 'text')
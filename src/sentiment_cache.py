@@ -0,0 +1,64 @@
+"""
+Content-Hash Cache for Sentiment Scores
+
+Stores sentiment scores on disk keyed by a hash of the scored text (and the
+model that scored it), so repeat pipeline runs only run inference on texts
+that have not been seen before.
+"""
+
+import hashlib
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.config import CACHE_DIR
+
+SENTIMENT_CACHE_PATH = CACHE_DIR / "sentiment.parquet"
+
+
+def text_hash(text: str, namespace: str = "") -> bytes:
+    """16-byte BLAKE2b digest of a text, scoped by namespace (e.g. the model name)."""
+    return hashlib.blake2b(f"{namespace}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+def get_or_compute(
+    texts: list,
+    scorer: Callable[[list], np.ndarray],
+    namespace: str = "",
+    path=SENTIMENT_CACHE_PATH
+) -> np.ndarray:
+    """
+    Look up sentiment scores by text hash, scoring only the cache misses.
+
+    Args:
+        texts: Texts to score
+        scorer: Function mapping a list of texts to an array of scores
+        namespace: Scope for the hash keys, so scores from different models
+            never collide
+        path: Parquet file holding the (hash, score) cache
+
+    Returns:
+        Array of scores aligned with texts
+    """
+    cached = pd.read_parquet(path) if path.exists() else pd.DataFrame({"hash": [], "score": []})
+    lookup = dict(zip(cached["hash"], cached["score"]))
+
+    hashes = [text_hash(text, namespace) for text in texts]
+
+    # Score each distinct missing text once
+    missing = {}
+    for i, h in enumerate(hashes):
+        if h not in lookup and h not in missing:
+            missing[h] = i
+
+    if missing:
+        print(f"Sentiment cache: {len(texts) - len(missing)} hits, {len(missing)} texts to score")
+        new_scores = np.asarray(scorer([texts[i] for i in missing.values()]), dtype=np.float32)
+        lookup.update(zip(missing, new_scores))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        new_rows = pd.DataFrame({"hash": list(missing), "score": new_scores})
+        pd.concat([cached, new_rows], ignore_index=True).to_parquet(path, index=False)
+
+    return np.array([lookup[h] for h in hashes], dtype=np.float64)